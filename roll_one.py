@@ -76,8 +76,10 @@ def main(debug=False):
             r = sign_in()
             trivial_passes_count = _trivial_passes_per_heartbeat - 1
             while True:
-                was_mail = process_mail(r)
-                was_sub = scan_submissions(seen_by_sentinel, r)
+                # Thread snapshots are shared by mail and sentinel for one pass
+                threads = {}
+                was_mail = process_mail(r, threads)
+                was_sub = scan_submissions(seen_by_sentinel, r, threads)
                 trivial_passes_count += 1 if not was_mail and not was_sub else 0
                 if trivial_passes_count == _trivial_passes_per_heartbeat:
                     lprint("Heartbeat.  {} passes without incident (or first pass).".format(_trivial_passes_per_heartbeat))
@@ -92,7 +94,7 @@ def main(debug=False):
 
 
 # Returns true if anything happened
-def scan_submissions(seen, r):
+def scan_submissions(seen, r, threads=None):
     '''This function groups the following:
     * Get the newest submissions to /r/DnDBehindTheStreen
     * Attempt to parse the item as containing tables
@@ -101,7 +103,11 @@ def scan_submissions(seen, r):
     # * Update list of seen tables
     # * Prune seen tables list if large.
 
+    threads is the per-pass cache of thread snapshots; see get_thread.
+
     '''
+    if threads is None:
+        threads = {}
     try:
         keep_it_tidy_reply = (
             "It looks like this post has some tables I might be able to parse."
@@ -115,14 +121,13 @@ def scan_submissions(seen, r):
         for item in new_subs:
             TS = TableSource(item, "scan")
             if TS.tables:
-                top_level_authors = [com.author for com in TS.source.comments]
                 # Check if I have already replied
                 if not TS.source in seen:
-                    seen.append(TS.source)
-                    if not r.user in top_level_authors:
+                    if not has_top_level_comment_by(r, item.id, r.user, threads):
                         item.add_comment(keep_it_tidy_reply)
                         lprint("Adding organizational comment to thread with title: {}".format(TS.source.title))
                         saw_something_said_something = True
+                    seen.append(TS.source)
 
         # Prune list to max size
         seen[:] = seen[-_seen_max_len:]
@@ -133,10 +138,12 @@ def scan_submissions(seen, r):
 
 
 # returns True if anything processed
-def process_mail(r):
+def process_mail(r, threads=None):
     '''Processes notifications.  Returns True if any item was processed.'''
+    if threads is None:
+        threads = {}
     my_mail = list(r.get_unread(unset_has_mail=False))
-    to_process = [Request(x, r) for x in my_mail]
+    to_process = [Request(x, r, threads) for x in my_mail]
     for item in to_process:
         if item.is_summons() or item.is_PM():
             reply_text = item.roll()
@@ -217,13 +224,15 @@ These are then built into TableRoll objects for reporting.
 '''
 
 class Request:
-    def __init__(self, praw_ref, r):
+    def __init__(self, praw_ref, r, threads=None):
         self.origin = praw_ref
         self.reddit = r
+        # This Request's thread snapshot, if default sources were used
+        self.thread = None
         self.tables_sources = []
         self.outcome = None
 
-        self._parse()
+        self._parse(threads if threads is not None else {})
 
     def __repr__(self):
         return "<Request from >".format(str(self))
@@ -231,17 +240,18 @@ class Request:
     def __str__(self):
         via = None
         if type(self.origin) == praw.objects.Comment:
-            via = "mention in {}".format(self.origin.submission.title)
+            via = "mention in {}".format(self.get_submission().title)
         elif type(self.origin) == praw.objects.Message:
             via = "private message"
         else:
             via = "a mystery!"
         return "/u/{} via {}".format(self.origin.author, via)
 
-    def _parse(self):
+    def _parse(self, threads):
         '''Fetches text of submission and top-level comments from thread
         containing this Request.  Builds a TableSource for each, and
-        attempts to parse each for tables.
+        attempts to parse each for tables.  threads is the per-pass
+        cache of thread snapshots; see get_thread.
 
         '''
         # Default behavior: OP and top-level comments, as applicable
@@ -252,7 +262,7 @@ class Request:
             self.get_link_sources()
         else:
             #print("Adding default set...", file=sys.stderr)
-            self.get_default_sources()
+            self.get_default_sources(threads)
 
 
 
@@ -286,14 +296,15 @@ class Request:
                     self.reddit.get_submission(href),
                     desc)
                 
-    def get_default_sources(self):
+    def get_default_sources(self, threads):
         '''Default sources are OP and top-level comments'''
         try:
+            # Avoids the thread fetch behind Comment.submission
+            self.thread = get_thread(self.reddit, get_submission_id(self.origin), threads)
             # Add OP
-            self._maybe_add_source(self.origin.submission, "this thread's original post")
+            self._maybe_add_source(self.thread, "this thread's original post")
             # Add Top-level comments
-            top_level_comments = self.reddit.get_submission(None, self.origin.submission.id).comments
-            for item in top_level_comments:
+            for item in get_top_level_comments(self.thread):
                 self._maybe_add_source(item, "[this]({}) comment by {}".format(item.permalink, item.author) )
         except:
             lprint("Could not add default sources.  (PM without links?)")
@@ -306,6 +317,13 @@ class Request:
     def reply(self, reply_text):
         self.origin.reply(reply_text)
 
+    def get_submission(self):
+        '''Returns the thread snapshot if one was fetched, falling back
+        to the origin's submission'''
+        if self.thread is not None:
+            return self.thread
+        return self.origin.submission
+
     def is_summons(self):
         return re.search(_summons_regex, get_post_text(self.origin).lower())
 
@@ -328,8 +346,9 @@ class Request:
                 f.write("Body    : Could not resolve message body.")
             f.write("\n")
             try:
-                f.write("Submission title : {}\n".format(self.origin.submission.title))
-                f.write("Submission body  : (below)\n[Begin selftext]\n{}\n[End selftext]\n".format(self.origin.submission.selftext))
+                submission = self.get_submission()
+                f.write("Submission title : {}\n".format(submission.title))
+                f.write("Submission body  : (below)\n[Begin selftext]\n{}\n[End selftext]\n".format(submission.selftext))
             except:
                 f.write("Submission: Could not resolve submission.")
         filename = filename.rstrip("log") + "pickle"
@@ -608,6 +627,51 @@ def get_post_text(post):
                " non-Comment / non-Submission post; returning empty string")
         return ""
 
+def get_submission_id(comment):
+    '''Returns the id of the submission containing comment, without
+    fetching it.  Inbox comments have no link_id, so read it from
+    context as PRAW does for the /message page.'''
+    if getattr(comment, 'context', None):
+        return comment.context.split('/')[4]
+    return comment.link_id[3:]
+
+def get_thread(r, submission_id, threads):
+    '''Returns the depth=1 fetch of a submission, cached in threads by
+    submission id for one pass'''
+    if not submission_id in threads:
+        threads[submission_id] = r.get_submission(
+            submission_id=submission_id,
+            params={'depth': 1})
+    return threads[submission_id]
+
+def get_top_level_comments(thread):
+    '''Returns the loaded top-level comments of a thread, skipping any
+    MoreComments stubs'''
+    return [com for com in thread.comments
+            if type(com) != praw.objects.MoreComments]
+
+def has_top_level_comment_by(r, submission_id, user, threads):
+    '''Returns True if user authored a top-level comment in the thread.
+    Top-level MoreComments stubs are only expanded if user is not
+    found among the comments already loaded.  The snapshot is shared
+    for the pass, so expanded comments are not added to it.
+
+    '''
+    thread = get_thread(r, submission_id, threads)
+    loaded = get_top_level_comments(thread)
+    if user in [com.author for com in loaded]:
+        return True
+    stubs = [com for com in thread.comments
+             if type(com) == praw.objects.MoreComments]
+    for stub in stubs:
+        # Expanded batches may hold replies; keep only top-level comments
+        expanded = [com for com in stub.comments(update=False) or []
+                    if type(com) == praw.objects.Comment
+                    and com.parent_id == thread.fullname]
+        if user in [com.author for com in expanded]:
+            return True
+    return False
+
 def fdate():
     return "-".join(str(x) for x in time.gmtime()[:6])
 